@@ -1,16 +1,62 @@
 from __future__ import annotations
 
-import json
-from dataclasses import asdict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import sys
 from pathlib import Path
-from typing import Dict, Any, List, Iterable
+from typing import Dict, Any, List, Iterable, Iterator, Optional, Tuple
 
+from . import json_utils
+from .ingest.cache import IngestCache
 from .ingest.pipeline import IngestPipeline
-from .parsing.regex_top_parser import RegexTopParser
+from .parsing.regex_top_parser import RegexTopParser, parsed_to_dicts
 from .tracker import build_tracker_rows
 from .export.excel_exporter import ExcelExporter
-from .pdf_ingest import save_corpus_json, ingested_to_corpus
+from .pdf_ingest import ingested_to_corpus, write_corpus_json
+
+_Result = Tuple[List[Dict[str, Any]], Dict[str, Any]]
+
+
+def _process_one(
+    pdf: Path,
+    pipeline: IngestPipeline,
+    parser: RegexTopParser,
+    corpus_dir: Path,
+    corpus_suffix: str = ".json",
+    cache: Optional[IngestCache] = None,
+) -> _Result:
+    """
+    Ingest, persist and parse a single PDF.
+
+    Kept at module level so it can be shipped to worker processes; the corpus JSON is
+    written by the worker itself so only the parsed rows travel back to the caller.
+    """
+    entry = cache.entry_path(pdf) if cache is not None else None
+    ing = cache.load(entry) if entry is not None else None
+    if ing is None:
+        ing = pipeline.ingest(pdf)
+        if entry is not None:
+            cache.store(entry, ing)
+    # Build the corpus dict once and reuse it for the corpus file and the parser.
+    corpus = ingested_to_corpus(ing)
+    write_corpus_json(corpus, corpus_dir / f"{pdf.stem}{corpus_suffix}")
+    parsed = parser.parse(corpus)
+    parsed_dicts = parsed_to_dicts(parsed)
+    # approved is True/False/None, so one tally covers all three QA counters.
+    decisions = Counter(p.approved for p in parsed)
+
+    qa = {
+        "file": pdf.name,
+        "meeting_date": parsed[0].meeting_date if parsed else None,
+        "tops_detail": len(parsed_dicts),
+        "approved": decisions[True],
+        "rejected": decisions[False],
+        "unknown": decisions[None],
+        "used_ocr": ing.used_ocr,
+        "used_layout": ing.used_layout,
+        "avg_chars_per_page": round(ing.avg_chars_per_page, 1),
+    }
+    return parsed_dicts, qa
 
 
 class WEGTopApp:
@@ -25,64 +71,89 @@ class WEGTopApp:
         self._parser = parser
         self._exporter = exporter
 
+    def _iter_results(
+        self,
+        pdfs: List[Path],
+        corpus_dir: Path,
+        corpus_suffix: str,
+        cache: Optional[IngestCache],
+        jobs: int,
+    ) -> Iterator[Tuple[Path, Optional[_Result], Optional[Exception]]]:
+        """Yield `(pdf, result, error)` per PDF, in input order."""
+        shared = (self._pipeline, self._parser, corpus_dir, corpus_suffix, cache)
+        if jobs <= 1 or len(pdfs) <= 1:
+            for pdf in pdfs:
+                try:
+                    yield pdf, _process_one(pdf, *shared), None
+                except Exception as exc:  # pylint: disable=broad-except
+                    yield pdf, None, exc
+            return
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pdfs))) as executor:
+            futures = [executor.submit(_process_one, pdf, *shared) for pdf in pdfs]
+            try:
+                for pdf, future in zip(pdfs, futures):
+                    try:
+                        yield pdf, future.result(), None
+                    except Exception as exc:  # pylint: disable=broad-except
+                        yield pdf, None, exc
+            finally:
+                # Fail-fast (or any early exit) should not wait for queued PDFs.
+                for future in futures:
+                    future.cancel()
+
     def process_pdfs(
         self,
         pdfs: Iterable[Path],
         out_dir: Path,
         *,
         fail_fast: bool = False,
+        jobs: int = 1,
+        compress_corpus: bool = False,
+        cache_dir: Optional[Path] = None,
     ) -> None:
         corpus_dir = out_dir / "corpus"
+        corpus_suffix = ".json.gz" if compress_corpus else ".json"
+        cache = (
+            IngestCache(cache_dir, config_key=self._pipeline.config_key())
+            if cache_dir is not None
+            else None
+        )
         corpus_dir.mkdir(parents=True, exist_ok=True)
 
         all_rows: List[Dict[str, Any]] = []
         qa_rows: List[Dict[str, Any]] = []
         errors: List[Dict[str, Any]] = []
 
-        for pdf in pdfs:
-            try:
-                ing = self._pipeline.ingest(pdf)
-                corpus_path = corpus_dir / f"{pdf.stem}.json"
-                save_corpus_json(ing, corpus_path)
+        # Rows are appended as each PDF finishes instead of being dumped at the end, so the
+        # JSONL is complete up to the last processed file even if the run is interrupted.
+        parsed_jsonl = out_dir / "parsed_tops_detail.jsonl"
+        with parsed_jsonl.open("wb", buffering=1 << 20) as jsonl:
+            for pdf, result, exc in self._iter_results(
+                list(pdfs), corpus_dir, corpus_suffix, cache, jobs,
+            ):
+                if exc is not None:
+                    errors.append({"file": pdf.name, "error": str(exc)})
+                    print(f"[ERROR] {pdf.name}: {exc}", file=sys.stderr)
+                    if fail_fast:
+                        raise SystemExit(1) from exc
+                    continue
 
-                corpus = ingested_to_corpus(ing)
-                parsed = self._parser.parse(corpus)
-                parsed_dicts = [asdict(p) for p in parsed]
+                parsed_dicts, qa = result
+                # One write per PDF keeps the file append-as-you-go without per-row IO calls.
+                jsonl.write(b"".join(json_utils.dumps(rec) + b"\n" for rec in parsed_dicts))
                 all_rows.extend(parsed_dicts)
-
-                qa_rows.append({
-                    "file": pdf.name,
-                    "meeting_date": parsed[0].meeting_date if parsed else None,
-                    "tops_detail": len(parsed_dicts),
-                    "approved": sum(1 for r in parsed_dicts if r.get("approved") is True),
-                    "rejected": sum(1 for r in parsed_dicts if r.get("approved") is False),
-                    "unknown": sum(1 for r in parsed_dicts if r.get("approved") is None),
-                    "used_ocr": ing.used_ocr,
-                    "used_layout": ing.used_layout,
-                    "avg_chars_per_page": round(ing.avg_chars_per_page, 1),
-                })
+                qa_rows.append(qa)
 
                 print(
-                    f"[OK] {pdf.name}: detail_TOPs={len(parsed_dicts)} "
-                    f"approved={qa_rows[-1]['approved']} ocr={ing.used_ocr} avg_chars={ing.avg_chars_per_page:.1f}"
+                    f"[OK] {pdf.name}: detail_TOPs={qa['tops_detail']} "
+                    f"approved={qa['approved']} ocr={qa['used_ocr']} "
+                    f"avg_chars={qa['avg_chars_per_page']:.1f}"
                 )
-            except Exception as exc:  # pylint: disable=broad-except
-                errors.append({"file": pdf.name, "error": str(exc)})
-                print(f"[ERROR] {pdf.name}: {exc}", file=sys.stderr)
-                if fail_fast:
-                    raise SystemExit(1) from exc
-
-        parsed_jsonl = out_dir / "parsed_tops_detail.jsonl"
-        parsed_jsonl.parent.mkdir(parents=True, exist_ok=True)
-        with parsed_jsonl.open("w", encoding="utf-8") as f:
-            for rec in all_rows:
-                f.write(json.dumps(rec, ensure_ascii=False) + "\n")
 
         if errors:
             errors_path = out_dir / "errors.jsonl"
-            with errors_path.open("w", encoding="utf-8") as f:
-                for err in errors:
-                    f.write(json.dumps(err, ensure_ascii=False) + "\n")
+            errors_path.write_bytes(b"".join(json_utils.dumps(err) + b"\n" for err in errors))
             print(f"[WARN] {len(errors)} file(s) failed. See: {errors_path}", file=sys.stderr)
 
         tracker_rows = build_tracker_rows(all_rows)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 from pathlib import Path
 
 from .app import WEGTopApp
@@ -9,17 +10,62 @@ from .export.excel_exporter import ExcelExporter
 from .ingest.ocr_extractor import OcrExtractor
 from .ingest.pdfplumber_extractor import PdfPlumberExtractor
 from .ingest.pipeline import IngestPipeline
+from .ingest.pymupdf_extractor import PyMuPdfExtractor, PyMuPdfOcrExtractor
 from .parsing.regex_top_parser import RegexTopParser
 
 def main() -> None:
     ap = argparse.ArgumentParser(prog="wegtop")
     ap.add_argument("--in_dir", required=True, help="Directory containing PDF files")
     ap.add_argument("--out_dir", default="out", help="Output directory")
+    ap.add_argument(
+        "--backend",
+        choices=("pdfplumber", "pymupdf"),
+        default="pdfplumber",
+        help="PDF library for text extraction and OCR rendering (pymupdf needs the extra)",
+    )
+    ap.add_argument(
+        "--page_workers",
+        type=int,
+        default=1,
+        help="Processes extracting pages of one PDF in parallel (pdfplumber backend only)",
+    )
     ap.add_argument("--ocr", action="store_true", help="Enable OCR fallback for low-text PDFs (optional)")
     ap.add_argument("--min_avg_chars", type=int, default=250, help="OCR/layout trigger threshold")
     ap.add_argument("--ocr_dpi", type=int, default=140, help="OCR render DPI")
     ap.add_argument("--max_ocr_pages", type=int, default=None, help="Limit OCR pages for large PDFs")
+    ap.add_argument(
+        "--ocr_workers",
+        type=int,
+        default=None,
+        help="Parallel tesseract runs per PDF (default: CPU count divided by --jobs)",
+    )
+    ap.add_argument(
+        "--ocr_binarize",
+        action="store_true",
+        help="Convert rendered pages to black/white (Otsu) before OCR",
+    )
+    ap.add_argument(
+        "--compress_corpus",
+        action="store_true",
+        help="Write corpus files as gzip-compressed JSON (corpus/*.json.gz)",
+    )
+    ap.add_argument(
+        "--no_cache",
+        action="store_true",
+        help="Re-ingest every PDF instead of reusing results cached in <out_dir>/.cache",
+    )
+    ap.add_argument(
+        "--no_excerpt",
+        action="store_true",
+        help="Leave raw_excerpt empty in the outputs (smaller JSONL/Excel, less memory)",
+    )
     ap.add_argument("--fail_fast", action="store_true", help="Stop on first PDF error")
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of PDFs processed in parallel (default: CPU count)",
+    )
     args = ap.parse_args()
 
     logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
@@ -31,9 +77,32 @@ def main() -> None:
     if not pdfs:
         raise SystemExit(f"No PDFs found in: {in_dir}")
 
-    primary = PdfPlumberExtractor(layout=False)
-    layout_extractor = PdfPlumberExtractor(layout=True)
-    ocr_extractor = OcrExtractor(dpi=args.ocr_dpi, max_pages=args.max_ocr_pages) if args.ocr else None
+    if args.backend == "pymupdf":
+        primary = PyMuPdfExtractor(layout=False)
+        layout_extractor = PyMuPdfExtractor(layout=True)
+        ocr_cls = PyMuPdfOcrExtractor
+    else:
+        primary = PdfPlumberExtractor(layout=False, workers=args.page_workers)
+        layout_extractor = PdfPlumberExtractor(layout=True, workers=args.page_workers)
+        ocr_cls = OcrExtractor
+    # Every PDF processed concurrently runs its own OCR pool, so split the cores between
+    # them rather than giving each one a pool of CPU-count tesseract processes.
+    concurrent_pdfs = max(1, min(args.jobs, len(pdfs)))
+    ocr_workers = args.ocr_workers or max(1, (os.cpu_count() or 1) // concurrent_pdfs)
+    if args.ocr:
+        # tesseract's OpenMP threads would multiply with the parallel runs; keep each run
+        # single-threaded unless the environment already says otherwise.
+        os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    ocr_extractor = (
+        ocr_cls(
+            dpi=args.ocr_dpi,
+            max_pages=args.max_ocr_pages,
+            workers=ocr_workers,
+            binarize=args.ocr_binarize,
+        )
+        if args.ocr
+        else None
+    )
     pipeline = IngestPipeline(
         primary_extractor=primary,
         layout_extractor=layout_extractor,
@@ -42,11 +111,18 @@ def main() -> None:
     )
     app = WEGTopApp(
         ingest_pipeline=pipeline,
-        parser=RegexTopParser(),
+        parser=RegexTopParser(include_excerpt=not args.no_excerpt),
         exporter=ExcelExporter(),
     )
 
-    app.process_pdfs(pdfs, out_dir, fail_fast=args.fail_fast)
+    app.process_pdfs(
+        pdfs,
+        out_dir,
+        fail_fast=args.fail_fast,
+        jobs=args.jobs,
+        compress_corpus=args.compress_corpus,
+        cache_dir=None if args.no_cache else out_dir / ".cache",
+    )
 
     print(f"Outputs written to: {out_dir}")
 
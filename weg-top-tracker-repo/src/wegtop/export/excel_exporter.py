@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 from pathlib import Path
-import math
-import re
 from typing import Dict, List, Any
 
 import pandas as pd
 
 
+def _excel_writer(out_path: Path) -> pd.ExcelWriter:
+    # xlsxwriter streams the workbook straight to the zip instead of building an openpyxl
+    # DOM first. constant_memory stays off: pandas writes cells column by column, which
+    # that mode does not support. strings_to_urls=False keeps URL-looking titles as text.
+    return pd.ExcelWriter(
+        out_path,
+        engine="xlsxwriter",
+        engine_kwargs={"options": {"strings_to_urls": False}},
+    )
+
+
 class ExcelExporter:
     def export(
         self,
@@ -22,7 +31,7 @@ class ExcelExporter:
         df_all = pd.DataFrame(all_tops_rows)
         df_qa = pd.DataFrame(qa_rows)
 
-        with pd.ExcelWriter(out_path, engine="openpyxl") as writer:
+        with _excel_writer(out_path) as writer:
             df_tracker.to_excel(writer, sheet_name="Approved_TOPs", index=False)
             df_qa.to_excel(writer, sheet_name="QA_Summary", index=False)
             df_all.to_excel(writer, sheet_name="All_TOPs_Detail", index=False)
@@ -34,43 +43,36 @@ class ExcelExporter:
         qa_rows: List[Dict[str, Any]],
         out_path: Path,
     ) -> None:
-        def year_from_date(d):
-            if not isinstance(d, str) or "-" not in d:
-                return None
-            try:
-                return int(d.split("-")[0])
-            except ValueError:
-                return None
-
-        def sort_key_top(x: str):
-            if x is None:
-                return (9999, "")
-            if isinstance(x, float) and math.isnan(x):
-                return (9999, "")
-            m = re.match(r"(\d+)(.*)", str(x))
-            if not m:
-                return (9999, str(x))
-            return (int(m.group(1)), m.group(2))
-
         df_all = pd.DataFrame(all_tops_rows)
         df_qa = pd.DataFrame(qa_rows)
 
-        df_all["year"] = df_all["meeting_date"].apply(year_from_date)
-        years = sorted([int(y) for y in df_all["year"].dropna().unique()])
+        # Vectorised replacements for per-row Python callbacks: the year is the leading
+        # integer of an ISO date, and TOPs sort by (leading number, suffix),
+        # e.g. "2" < "2.1" < "10".
+        dates = df_all["meeting_date"].astype("string")
+        df_all["year"] = pd.to_numeric(dates.str.extract(r"^(\d+)-", expand=False)).astype("Int64")
+        years = sorted(int(y) for y in df_all["year"].dropna().unique())
+
+        tops = df_all["top_number"].astype("string")
+        parts = tops.str.extract(r"^(\d+)(.*)")
+        df_all["_top_num"] = pd.to_numeric(parts[0]).fillna(9999).astype("int64")
+        df_all["_top_suf"] = parts[1].fillna(tops).fillna("")
+
+        cols = [
+            "meeting_date", "top_number", "top_title",
+            "votes_yes", "votes_no", "votes_abstain",
+            "source_file", "page_start", "page_end",
+        ]
+        # Sort the approved subset once and split it with a single groupby; groupby keeps
+        # the row order within each group. Years without approved TOPs still get a sheet.
+        approved = df_all[df_all["approved"].eq(True)].sort_values(
+            ["meeting_date", "_top_num", "_top_suf"],
+            na_position="last",
+        )
+        by_year = {int(y): dfa for y, dfa in approved.groupby("year", sort=False)}
 
-        with pd.ExcelWriter(out_path, engine="openpyxl") as writer:
+        with _excel_writer(out_path) as writer:
             for y in years:
-                dfa = df_all[(df_all["year"] == y) & (df_all["approved"].eq(True))].copy()
-                if not dfa.empty:
-                    dfa = dfa.sort_values(
-                        ["meeting_date", "top_number"],
-                        key=lambda s: s.map(sort_key_top),
-                        na_position="last",
-                    )
-                cols = [
-                    "meeting_date", "top_number", "top_title",
-                    "votes_yes", "votes_no", "votes_abstain",
-                    "source_file", "page_start", "page_end",
-                ]
+                dfa = by_year.get(y, approved.iloc[:0])
                 dfa[cols].to_excel(writer, sheet_name=str(y), index=False)
             df_qa.to_excel(writer, sheet_name="QA_Summary", index=False)
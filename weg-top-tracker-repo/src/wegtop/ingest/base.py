@@ -1,11 +1,32 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Protocol
+from typing import Any, ContextManager, List, Protocol, Sequence, runtime_checkable
 
 from ..models import PageText
 
 
 class TextExtractor(Protocol):
+    """Returns one `PageText` per page; page texts are expected to be `normalize_text` output."""
+
     def extract(self, pdf_path: Path) -> List[PageText]:
         ...
+
+
+@runtime_checkable
+class DocumentTextExtractor(TextExtractor, Protocol):
+    """Extractor that can reuse an already opened document across several passes."""
+
+    def open_document(self, pdf_path: Path) -> ContextManager[Any]:
+        ...
+
+    def extract_document(self, document: Any) -> List[PageText]:
+        ...
+
+
+@runtime_checkable
+class PageSubsetExtractor(TextExtractor, Protocol):
+    """Extractor that can process only selected pages (0-based indices)."""
+
+    def extract_pages(self, pdf_path: Path, page_indices: Sequence[int]) -> List[PageText]:
+        ...
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from .. import __version__, json_utils
+from ..models import IngestedPDF, PageText
+
+LOGGER = logging.getLogger(__name__)
+
+
+class IngestCache:
+    """
+    On-disk cache of ingest results, keyed by PDF path, mtime, size and the pipeline
+    configuration. Entries invalidate themselves when the file or the config changes;
+    stale files are simply never read again.
+    """
+
+    def __init__(self, cache_dir: Path, *, config_key: str) -> None:
+        self._dir = cache_dir
+        self._config_key = f"{__version__}:{config_key}"
+
+    def entry_path(self, pdf_path: Path) -> Path:
+        """
+        Cache file for the PDF's current path, mtime and size. Take it once, before
+        ingesting, and pass it to both `load` and `store`: a PDF replaced during a long
+        ingest must not have the old content cached under the new file's key.
+        """
+        st = pdf_path.stat()
+        ident = f"{pdf_path.resolve()}:{st.st_mtime_ns}:{st.st_size}:{self._config_key}"
+        digest = hashlib.blake2b(ident.encode("utf-8"), digest_size=16).hexdigest()
+        return self._dir / f"{digest}.json.gz"
+
+    def load(self, entry: Path) -> Optional[IngestedPDF]:
+        try:
+            data = json_utils.loads(gzip.decompress(entry.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable ingest cache entry %s: %s", entry, exc)
+            return None
+        return IngestedPDF(
+            source_path=data["source_path"],
+            pages=[PageText(p["page_index"], p["text"], p["char_count"]) for p in data["pages"]],
+            used_layout=data["used_layout"],
+            used_ocr=data["used_ocr"],
+            avg_chars_per_page=data["avg_chars_per_page"],
+        )
+
+    def store(self, entry: Path, ingested: IngestedPDF) -> None:
+        payload = {
+            "source_path": ingested.source_path,
+            "used_layout": ingested.used_layout,
+            "used_ocr": ingested.used_ocr,
+            "avg_chars_per_page": ingested.avg_chars_per_page,
+            "pages": [
+                {"page_index": p.page_index, "char_count": p.char_count, "text": p.text}
+                for p in ingested.pages
+            ],
+        }
+        # The ingest result is already in hand; losing the cache entry only costs a rerun.
+        try:
+            self._write(entry, gzip.compress(json_utils.dumps(payload), compresslevel=6))
+        except OSError as exc:
+            LOGGER.warning("Could not write ingest cache entry %s: %s", entry, exc)
+
+    def _write(self, entry: Path, data: bytes) -> None:
+        self._dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so parallel workers never see a partial entry.
+        fd, tmp_name = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, entry)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
@@ -1,43 +1,123 @@
 from __future__ import annotations
 
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 
 from ..models import PageText
 from ..text_utils import normalize_text
-from .base import TextExtractor
+from .base import PageSubsetExtractor
 
 
-class OcrExtractor(TextExtractor):
-    def __init__(self, *, dpi: int = 140, lang: str = "deu+eng", max_pages: Optional[int] = None) -> None:
+def _page_runs(page_indices: Sequence[int]) -> List[Tuple[int, int]]:
+    """Group sorted 0-based page indices into inclusive `(first, last)` runs."""
+    runs: List[Tuple[int, int]] = []
+    for idx in page_indices:
+        if runs and idx == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], idx)
+        else:
+            runs.append((idx, idx))
+    return runs
+
+
+def _otsu_threshold(gray: Any) -> int:
+    """Otsu's threshold for an 8-bit grayscale numpy array."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    weight_bg = np.cumsum(hist)
+    weight_fg = weight_bg[-1] - weight_bg
+    mass_bg = np.cumsum(hist * np.arange(256))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        between = (mass_bg[-1] * weight_bg - mass_bg * weight_bg[-1]) ** 2 / (weight_bg * weight_fg)
+    return int(np.argmax(np.nan_to_num(between)))
+
+
+def _binarize_image(image_path: str) -> None:
+    """Rewrite a rendered page in place as a black/white image (grayscale + Otsu)."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+    from PIL import Image  # pylint: disable=import-outside-toplevel
+
+    with Image.open(image_path) as img:
+        gray = np.asarray(img.convert("L"))
+    bw = np.where(gray > _otsu_threshold(gray), 255, 0).astype(np.uint8)
+    Image.fromarray(bw).convert("1").save(image_path)
+
+
+class OcrExtractor(PageSubsetExtractor):
+    def __init__(
+        self,
+        *,
+        dpi: int = 140,
+        lang: str = "deu+eng",
+        max_pages: Optional[int] = None,
+        workers: Optional[int] = None,
+        binarize: bool = False,
+    ) -> None:
         self._dpi = dpi
         self._lang = lang
         self._max_pages = max_pages
+        self._workers = workers or os.cpu_count() or 1
+        self._binarize = binarize
 
     def extract(self, pdf_path: Path) -> List[PageText]:
-        # Optional dependencies kept local to allow running without OCR extras.
-        from pdf2image import convert_from_path, pdfinfo_from_path  # pylint: disable=import-outside-toplevel
-        import pytesseract  # pylint: disable=import-outside-toplevel
-
-        info = pdfinfo_from_path(str(pdf_path))
-        total_pages = int(info.get("Pages") or 0)
+        total_pages = self._page_count(pdf_path)
         if total_pages <= 0:
             return []
+        return self.extract_pages(pdf_path, range(total_pages))
+
+    def extract_pages(self, pdf_path: Path, page_indices: Sequence[int]) -> List[PageText]:
+        import pytesseract  # pylint: disable=import-outside-toplevel
+
+        indices = sorted(set(page_indices))
         if self._max_pages is not None:
-            total_pages = min(total_pages, self._max_pages)
+            indices = indices[: self._max_pages]
+        if not indices:
+            return []
+
+        def ocr_page(image_path: str) -> str:
+            if not self._binarize:
+                return normalize_text(pytesseract.image_to_string(image_path, lang=self._lang))
+            # A pre-thresholded 1-bit page is a smaller file for tesseract to load, and it
+            # no longer needs tesseract's own inversion check.
+            _binarize_image(image_path)
+            return normalize_text(pytesseract.image_to_string(
+                image_path, lang=self._lang, config="-c tessedit_do_invert=0",
+            ))
+
+        with tempfile.TemporaryDirectory(prefix="wegtop-ocr-") as tmp_dir:
+            image_paths = self._render_pages(pdf_path, indices, tmp_dir)
+            # tesseract runs as a subprocess, so threads are enough to keep all cores busy.
+            with ThreadPoolExecutor(max_workers=self._workers) as executor:
+                texts = list(executor.map(ocr_page, image_paths))
+        return [PageText(i, txt, len(txt)) for i, txt in zip(indices, texts)]
+
+    def _page_count(self, pdf_path: Path) -> int:
+        # Optional dependencies kept local to allow running without OCR extras.
+        from pdf2image import pdfinfo_from_path  # pylint: disable=import-outside-toplevel
+
+        info = pdfinfo_from_path(str(pdf_path))
+        return int(info.get("Pages") or 0)
+
+    def _render_pages(self, pdf_path: Path, indices: List[int], out_dir: str) -> List[str]:
+        """Render the given sorted 0-based pages to image files in `out_dir`, in order."""
+        from pdf2image import convert_from_path  # pylint: disable=import-outside-toplevel
 
-        pages: List[PageText] = []
-        for page_num in range(1, total_pages + 1):
-            images = convert_from_path(
+        # One pdftoppm run per contiguous page range instead of one per page; pdf2image
+        # splits a long range over `thread_count` pdftoppm processes rendering in parallel.
+        # Pages are written to disk (paths_only) so memory stays flat on long PDFs.
+        image_paths: List[str] = []
+        for first, last in _page_runs(indices):
+            image_paths.extend(convert_from_path(
                 str(pdf_path),
                 dpi=self._dpi,
-                first_page=page_num,
-                last_page=page_num,
-            )
-            if not images:
-                continue
-            img = images[0]
-            raw = pytesseract.image_to_string(img, lang=self._lang)
-            txt = normalize_text(raw)
-            pages.append(PageText(page_num - 1, txt, len(txt)))
-        return pages
+                first_page=first + 1,
+                last_page=last + 1,
+                output_folder=out_dir,
+                paths_only=True,
+                fmt="png",
+                thread_count=min(self._workers, last - first + 1),
+            ))
+        return image_paths
@@ -1,27 +1,112 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List
 
 import pdfplumber
 
 from ..models import PageText
 from ..text_utils import normalize_text
-from .base import TextExtractor
+from .base import DocumentTextExtractor
 
 
-class PdfPlumberExtractor(TextExtractor):
-    def __init__(self, *, layout: bool) -> None:
+def chars_to_text(
+    chars: List[Dict[str, Any]],
+    *,
+    line_tolerance: float = 3.0,
+    space_tolerance: float = 3.0,
+) -> str:
+    """
+    Cheap reading-order text from pdfplumber `page.chars`:
+    cluster characters into lines by `top` (a new line starts once a char sits more than
+    `line_tolerance` below the line's first char), sort each line by `x0`, and insert a
+    space when the horizontal gap exceeds `space_tolerance` (pdfplumber's default x_tolerance).
+    """
+    lines: List[List[Dict[str, Any]]] = []
+    line_top = 0.0
+    for c in sorted(chars, key=lambda c: c["top"]):
+        if not lines or c["top"] - line_top > line_tolerance:
+            lines.append([])
+            line_top = c["top"]
+        lines[-1].append(c)
+
+    parts: List[str] = []
+    for line in lines:
+        if parts:
+            parts.append("\n")
+        prev_x1 = None
+        for c in sorted(line, key=lambda c: c["x0"]):
+            if prev_x1 is not None and c["x0"] - prev_x1 > space_tolerance:
+                parts.append(" ")
+            parts.append(c["text"])
+            prev_x1 = c["x1"]
+    return "".join(parts)
+
+
+def _page_text(page: Any, layout: bool) -> str:
+    # pdfplumber's layout=True mode clusters every character into columns, which is
+    # far more work than the "did we get more text?" retry needs.
+    chars = getattr(page, "chars", None) if layout else None
+    if chars:
+        return normalize_text(chars_to_text(chars))
+    try:
+        raw = page.extract_text(layout=layout) or ""
+    except TypeError:
+        raw = page.extract_text() or ""
+    return normalize_text(raw)
+
+
+def _extract_range(pdf_path: str, layout: bool, start: int, end: int) -> List[PageText]:
+    """Worker entry point: extract pages `[start, end)` from a separately opened PDF."""
+    pages: List[PageText] = []
+    with pdfplumber.open(pdf_path, pages=list(range(start + 1, end + 1))) as pdf:
+        for page in pdf.pages:
+            txt = _page_text(page, layout)
+            pages.append(PageText(page.page_number - 1, txt, len(txt)))
+    return pages
+
+
+class PdfPlumberExtractor(DocumentTextExtractor):
+    # Below this many pages per worker, process start-up and re-opening the PDF cost more
+    # than the extraction they parallelise.
+    MIN_PAGES_PER_WORKER = 4
+
+    def __init__(self, *, layout: bool, workers: int = 1) -> None:
         self._layout = layout
+        self._workers = max(1, workers)
+
+    def open_document(self, pdf_path: Path) -> Any:
+        return pdfplumber.open(str(pdf_path))
 
     def extract(self, pdf_path: Path) -> List[PageText]:
+        with self.open_document(pdf_path) as pdf:
+            return self.extract_document(pdf)
+
+    def extract_document(self, document: Any) -> List[PageText]:
+        path = getattr(document, "path", None)
+        total = len(document.pages)
+        workers = min(self._workers, total // self.MIN_PAGES_PER_WORKER)
+        if path is not None and workers > 1:
+            return self._extract_sharded(str(path), total, workers)
+
         pages: List[PageText] = []
-        with pdfplumber.open(str(pdf_path)) as pdf:
-            for i, page in enumerate(pdf.pages):
-                try:
-                    raw = page.extract_text(layout=self._layout) or ""
-                except TypeError:
-                    raw = page.extract_text() or ""
-                txt = normalize_text(raw)
-                pages.append(PageText(i, txt, len(txt)))
+        for i, page in enumerate(document.pages):
+            txt = _page_text(page, self._layout)
+            pages.append(PageText(i, txt, len(txt)))
         return pages
+
+    def _extract_sharded(self, pdf_path: str, total: int, workers: int) -> List[PageText]:
+        # pdfminer is pure Python, so pages are split into contiguous ranges and
+        # extracted in separate processes, each opening the file itself.
+        bounds = [total * k // workers for k in range(workers + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(
+                _extract_range,
+                repeat(pdf_path),
+                repeat(self._layout),
+                bounds[:-1],
+                bounds[1:],
+            )
+            return [page for chunk in chunks for page in chunk]
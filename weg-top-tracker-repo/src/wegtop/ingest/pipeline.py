@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import logging
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, ContextManager, List, Optional
 
 from ..models import IngestedPDF, PageText
-from .base import TextExtractor
+from .base import DocumentTextExtractor, PageSubsetExtractor, TextExtractor
 
 LOGGER = logging.getLogger(__name__)
 
@@ -14,6 +15,16 @@ def _avg_chars(pages: List[PageText]) -> float:
     return (sum(p.char_count for p in pages) / len(pages)) if pages else 0.0
 
 
+def _merge_pages(pages: List[PageText], replacements: List[PageText]) -> List[PageText]:
+    """Per page, keep whichever text is longer."""
+    by_index = {p.page_index: p for p in pages}
+    for p in replacements:
+        current = by_index.get(p.page_index)
+        if current is None or p.char_count > current.char_count:
+            by_index[p.page_index] = p
+    return [by_index[i] for i in sorted(by_index)]
+
+
 class IngestPipeline:
     def __init__(
         self,
@@ -34,22 +45,64 @@ class IngestPipeline:
         self._ocr_gain = ocr_gain_ratio
         self._ocr_min = ocr_min_chars
 
+    def config_key(self) -> str:
+        """Stable description of everything that influences `ingest` output (for caching)."""
+        def describe(extractor: Optional[TextExtractor]) -> str:
+            if extractor is None:
+                return "-"
+            # Parallelism settings change how fast pages are produced, not what they contain.
+            settings = sorted(
+                (k, v) for k, v in getattr(extractor, "__dict__", {}).items() if k != "_workers"
+            )
+            return f"{type(extractor).__qualname__}{settings}"
+
+        return "|".join((
+            describe(self._primary),
+            describe(self._layout),
+            describe(self._ocr),
+            f"{self._min_avg}:{self._layout_gain}:{self._ocr_gain}:{self._ocr_min}",
+        ))
+
+    def _open_shared(self, pdf_path: Path) -> ContextManager[Any]:
+        # Primary and layout passes can share one parsed document when both extractors
+        # are of the same kind; otherwise each pass opens the file itself.
+        if isinstance(self._primary, DocumentTextExtractor) and (
+            self._layout is None or type(self._layout) is type(self._primary)
+        ):
+            return self._primary.open_document(pdf_path)
+        return nullcontext()
+
+    @staticmethod
+    def _extract(extractor: TextExtractor, pdf_path: Path, document: Any) -> List[PageText]:
+        if document is not None and isinstance(extractor, DocumentTextExtractor):
+            return extractor.extract_document(document)
+        return extractor.extract(pdf_path)
+
+    def _extract_ocr(self, pdf_path: Path, pages: List[PageText]) -> List[PageText]:
+        # Only re-read text-poor pages when the extractor supports page subsets.
+        if pages and isinstance(self._ocr, PageSubsetExtractor):
+            weak = [p.page_index for p in pages if p.char_count < self._min_avg]
+            return self._ocr.extract_pages(pdf_path, weak)
+        return self._ocr.extract(pdf_path)
+
     def ingest(self, pdf_path: Path) -> IngestedPDF:
-        pages = self._primary.extract(pdf_path)
-        a0 = _avg_chars(pages)
         used_layout = False
         used_ocr = False
 
-        if self._layout is not None and a0 < self._min_avg:
-            pages_layout = self._layout.extract(pdf_path)
-            a1 = _avg_chars(pages_layout)
-            if a1 > a0 * self._layout_gain:
-                pages = pages_layout
-                used_layout = True
+        with self._open_shared(pdf_path) as document:
+            pages = self._extract(self._primary, pdf_path, document)
+            a0 = _avg_chars(pages)
+
+            if self._layout is not None and a0 < self._min_avg:
+                pages_layout = self._extract(self._layout, pdf_path, document)
+                a1 = _avg_chars(pages_layout)
+                if a1 > a0 * self._layout_gain:
+                    pages = pages_layout
+                    used_layout = True
 
         if self._ocr is not None and _avg_chars(pages) < self._min_avg:
             try:
-                pages_ocr = self._ocr.extract(pdf_path)
+                pages_ocr = _merge_pages(pages, self._extract_ocr(pdf_path, pages))
                 a2 = _avg_chars(pages_ocr)
                 if a2 > _avg_chars(pages) * self._ocr_gain and a2 > self._ocr_min:
                     pages = pages_ocr
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, List
+
+from ..models import PageText
+from ..text_utils import normalize_text
+from .base import DocumentTextExtractor
+from .ocr_extractor import OcrExtractor
+
+
+def _open(pdf_path: Path) -> Any:
+    # Optional dependency kept local to allow running without the pymupdf extra.
+    import pymupdf  # pylint: disable=import-outside-toplevel
+
+    return pymupdf.open(str(pdf_path))
+
+
+class PyMuPdfExtractor(DocumentTextExtractor):
+    """
+    Text extraction with PyMuPDF. The layout variant asks for text sorted into reading
+    order (top-left to bottom-right) instead of content-stream order.
+    """
+
+    def __init__(self, *, layout: bool) -> None:
+        self._layout = layout
+
+    def open_document(self, pdf_path: Path) -> Any:
+        return _open(pdf_path)
+
+    def extract(self, pdf_path: Path) -> List[PageText]:
+        with self.open_document(pdf_path) as doc:
+            return self.extract_document(doc)
+
+    def extract_document(self, document: Any) -> List[PageText]:
+        pages: List[PageText] = []
+        for i, page in enumerate(document):
+            txt = normalize_text(page.get_text("text", sort=self._layout) or "")
+            pages.append(PageText(i, txt, len(txt)))
+        return pages
+
+
+class PyMuPdfOcrExtractor(OcrExtractor):
+    """OCR extractor that renders pages in-process with PyMuPDF instead of pdftoppm."""
+
+    def _page_count(self, pdf_path: Path) -> int:
+        with _open(pdf_path) as doc:
+            return doc.page_count
+
+    def _render_pages(self, pdf_path: Path, indices: List[int], out_dir: str) -> List[str]:
+        image_paths: List[str] = []
+        with _open(pdf_path) as doc:
+            for i in indices:
+                path = os.path.join(out_dir, f"page-{i:05d}.png")
+                doc[i].get_pixmap(dpi=self._dpi).save(path)
+                image_paths.append(path)
+        return image_paths
@@ -0,0 +1,30 @@
+"""
+JSON encoding helpers.
+
+Uses `orjson` (C implementation, emits UTF-8 bytes directly) when the optional `fast`
+extra is installed and falls back to the stdlib encoder otherwise. Both paths produce
+the same compact/indented layout and keep non-ASCII text unescaped.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -4,14 +4,15 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 
-@dataclass
+# Pages are held in bulk (and pickled between worker processes), so skip per-instance dicts.
+@dataclass(slots=True)
 class PageText:
     page_index: int
     text: str
     char_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class IngestedPDF:
     source_path: str
     pages: List[PageText]
@@ -20,7 +21,8 @@ class IngestedPDF:
     avg_chars_per_page: float
 
 
-@dataclass
+# One instance per TOP across a whole batch run; slots keep each row at ~40% of the size.
+@dataclass(slots=True)
 class ParsedTOP:
     meeting_date: Optional[str]
     source_file: str
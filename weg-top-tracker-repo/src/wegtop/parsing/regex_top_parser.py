@@ -1,25 +1,85 @@
 from __future__ import annotations
 
 import re
-from dataclasses import asdict
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from functools import lru_cache, partial
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
 
 from ..models import ParsedTOP
 from ..text_utils import normalize_text, safe_int, clean_title_text, detect_title_orthography_issues
 
-TOP_HEADER_RE = re.compile(
-    r"(?mi)^\s*(?:(?:seite|s\.)\s*\d+[\s\).:-]+|\d+[\s\).:-]+)?"
-    r"(?:T\s*O\s*P|TOP|Tagesordnungspunkt|Tagesordnungs(?:punkt|p\.)?)\s+"
-    r"(\d+(?:(?:\s*[.,/]\s*|\s+)\d+)?[a-z]?)\b"
-)
+# Building blocks shared by the header patterns below, so the block splitter, the inline
+# title extraction and the header-line check cannot drift apart. A line may start with a
+# page or list number ("Seite 3", "2)"), then the TOP keyword and the TOP number.
+_HEADER_PREFIX = r"^\s*(?:(?:seite|s\.)\s*\d+[\s\).:-]+|\d+[\s\).:-]+)?"
+_TOP_KEYWORD = r"(?:T\s*O\s*P|Tagesordnungs(?:punkt|p\.)?)"
+_TOP_NUMBER = r"\d+(?:(?:\s*[.,/]\s*|\s+)\d+)?[a-z]?"
+
+TOP_HEADER_RE = re.compile(rf"(?mi){_HEADER_PREFIX}{_TOP_KEYWORD}\s+({_TOP_NUMBER})\b")
 PAGE_MARKER_RE = re.compile(r"<<<PAGE:(\d+)>>>")
 
+# All patterns are compiled once at import; the parse functions below only call methods
+# on these objects (no per-call `re.match(pattern_string, ...)` cache lookups).
+# Full match on a stripped TOP number: lead digits, then either a subpoint written with
+# a separator or a space ("17,1", "17 / 1", "17 1", optional letter) or anything else
+# on the same line. Horizontal whitespace only: numbers spanning lines are left as is.
+_TOP_NUMBER_RE = re.compile(
+    r"(\d+)(?:(?:[^\S\n]*[.,/][^\S\n]*|[^\S\n]+)(\d+)([a-z]?)|.*)", flags=re.I
+)
+_BLANK_LINES_RE = re.compile(r"\n{4,}")
+# Runs of characters between the line boundaries str.splitlines() recognises.
+_LINE_RE = re.compile(r"[^\n\r\v\f\x1c-\x1e\x85\u2028\u2029]+")
+_LINE_BREAK_RE = re.compile(r"[\n\r\v\f\x1c-\x1e\x85\u2028\u2029]")
+_NON_LF_BREAK_RE = re.compile(r"[\r\v\f\x1c-\x1e\x85\u2028\u2029]")
+_LEADING_INT_RE = re.compile(r"^(\d+)")
+_RUN_TOGETHER_RE = re.compile(r"\d{2,3}")
+_HEADER_INLINE_RE = re.compile(rf"(?i){_HEADER_PREFIX}{_TOP_KEYWORD}\s+{_TOP_NUMBER}\s*(.*)$")
+# Narrower keyword on purpose: "Tagesordnungsp." lines are not dropped as bare headers.
+_HEADER_ONLY_RE = re.compile(rf"(?i){_HEADER_PREFIX}(?:T\s*O\s*P|Tagesordnungspunkt)\s+\d")
+_VOTES_LABELED_RE = re.compile(
+    r"(?is)(?:Ja(?:-Stimmen)?|Jastimmen)\s*[:=]?\s*([\d\.]+).*?"
+    r"(?:Nein(?:-Stimmen)?|Neinstimmen)\s*[:=]?\s*([\d\.]+).*?"
+    r"Enthaltung(?:en)?\s*[:=]?\s*([\d\.]+)"
+)
+_VOTE_HINT_RE = re.compile(r"(?i)\b(stimmen|ja|nein|enth)\b")
+_VOTES_SLASH_RE = re.compile(r"\b([\d\.]{1,10})\s*/\s*([\d\.]{1,10})\s*/\s*([\d\.]{1,10})\b")
+_DATE_TEXT_RE = re.compile(r"(?i)\b(?:vom|am)\s+(\d{1,2})\.(\d{1,2})\.(\d{4})\b")
+_DATE_FILENAME_RE = re.compile(r"\b([0-3]\d)(0[1-9]|1[0-2])(20\d{2})\b")
+_SORT_KEY_RE = re.compile(r"(\d+)(.*)")
+
+# Decision keywords, matched against the lowercased block. Rejections win over approvals.
+# Entries that contain another entry are left out ("keine beschlussfassung" is covered by
+# "keine beschluss", "wird angenommen" by "angenommen"); that does not change any result.
+_REJECTED_KEYWORDS = (
+    "abgelehnt", "nicht angenommen", "nicht beschlossen", "kein beschluss", "zurückgestellt",
+    "vertagt", "ohne beschluss", "keine beschluss", "beschlussfassung entfällt",
+)
+_APPROVED_KEYWORDS = (
+    "angenommen", "beschließt", "wird beschlossen", "mehrheitlich beschlossen",
+    "beschluss gefasst",
+)
+_QUORUM_KEYWORDS = (
+    "einstimmigkeit", "quorum", "2/3", "zwei drittel", "3/4", "drei viertel",
+    "qualifizierte mehrheit",
+)
+
+# Lines starting with these (lowercased) end the multi-line title in extract_title.
+_TITLE_STOP_MARKERS = (
+    "abstimmungsergebnis", "ergebnis", "bemerkung", "sachverhalt", "begründung", "stimmberechtigt",
+)
+
 GARBAGE_TITLE_TOKENS = [
     "gez.", "seite ", "dsz_", "versammlungsleiter", "wohnungseigentümer",
     "verwaltungsbeiratsvorsitzender", "p60||", "clwti", "bmp", "altmp",
     "<<<page", "protokollabschrift der",
 ]
+# One scan for any token instead of one substring search per token. Faster on the short
+# per-line checks in extract_title, which make up most calls.
+_GARBAGE_TITLE_RE = re.compile("|".join(map(re.escape, GARBAGE_TITLE_TOKENS)))
 
 
 def is_garbage_title(title: Optional[str]) -> bool:
@@ -28,17 +88,27 @@ def is_garbage_title(title: Optional[str]) -> bool:
     t = title.strip().lower()
     if not t:
         return True
-    return any(tok in t for tok in GARBAGE_TITLE_TOKENS)
+    return _GARBAGE_TITLE_RE.search(t) is not None
 
 
-def join_pages_with_markers(pages: List[Dict[str, Any]]) -> str:
+def join_pages_with_markers(pages: List[Dict[str, Any]], *, normalized: bool = False) -> str:
+    """
+    Join page texts with `<<<PAGE:n>>>` marker lines. With `normalized=True` the page
+    texts are already `normalize_text` output, so only the blank-line runs created around
+    empty pages need collapsing (same result, without another full normalisation pass).
+    """
     parts: List[str] = []
     for p in pages:
         parts.append(f"\n<<<PAGE:{p['page_index']}>>>\n")
         parts.append(p.get("text", "") or "")
-    return normalize_text("\n".join(parts))
+    joined = "\n".join(parts)
+    if normalized:
+        return _BLANK_LINES_RE.sub("\n\n\n", joined).strip()
+    return normalize_text(joined)
 
 
+# Pure function over a small vocabulary ("1".."30", a few subpoints), called per header.
+@lru_cache(maxsize=1024)
 def normalize_top_number(raw: str) -> str:
     """
     Normalize common TOP number variants, especially OCR artifacts:
@@ -51,25 +121,19 @@ def normalize_top_number(raw: str) -> str:
     if not s:
         return s
 
-    # Keep optional letter suffix (e.g., "4a")
-    m = re.match(r"^\s*(\d+)(.*)\s*$", s)
+    m = _TOP_NUMBER_RE.fullmatch(s)
     if not m:
         return s
-    lead, rest = m.group(1), m.group(2).strip()
+    lead, sub, suffix = m.groups()
 
     # Most common OCR forms for subpoints: comma, slash, dot, or a space.
     # Examples: "17,1", "17/1", "17 1", "17 . 1"
-    m2 = re.match(r"^([.,/])\s*(\d+)([a-z]?)$", rest, flags=re.I)
-    if m2:
-        return f"{lead}.{m2.group(2)}{m2.group(3) or ''}".lower()
-
-    m3 = re.match(r"^(\d+)([a-z]?)$", rest, flags=re.I)
-    if m3:
-        # "17 1" captured as "17" + rest "1"
-        return f"{lead}.{m3.group(1)}{m3.group(2) or ''}".lower()
+    if sub is not None:
+        return f"{lead}.{sub}{suffix}".lower()
 
     # Already normal or weird; just normalize comma/slash to dot and remove spaces.
-    s = re.sub(r"\s+", "", s)
+    # str.split() drops the same (Unicode) whitespace as `\s+`, without a regex call.
+    s = "".join(s.split())
     s = s.replace(",", ".").replace("/", ".")
     return s.lower()
 
@@ -85,17 +149,17 @@ def repair_run_together_subtops(blocks: List[Dict[str, Any]]) -> Dict[str, str]:
     Returns mapping old->new for items that should be rewritten.
     """
     top_numbers = [b.get("top_number") for b in blocks]
-    majors: List[int] = []
+    # Leading integer per block (None if there is none), indexed like `blocks`.
+    majors_at: List[Optional[int]] = []
     for t in top_numbers:
-        m = re.match(r"^(\d+)", str(t))
-        if m:
-            majors.append(int(m.group(1)))
-    majors_set = set(majors)
+        m = _LEADING_INT_RE.match(str(t))
+        majors_at.append(int(m.group(1)) if m else None)
+    majors_set = {m for m in majors_at if m is not None}
     have = set(top_numbers)
     rewrites: Dict[str, str] = {}
 
     for i, t in enumerate(top_numbers):
-        if not re.fullmatch(r"\d{2,3}", str(t)):
+        if not _RUN_TOGETHER_RE.fullmatch(str(t)):
             continue
         n = int(t)
         # Only consider suspiciously large majors (typical meetings rarely have 20+ TOPs)
@@ -109,15 +173,9 @@ def repair_run_together_subtops(blocks: List[Dict[str, Any]]) -> Dict[str, str]:
         if base not in majors_set:
             continue
         # Only rewrite when the base TOP appears adjacent in the parsed sequence.
-        base_nearby = False
-        for j, t2 in enumerate(top_numbers):
-            if j == i:
-                continue
-            m2 = re.match(r"^(\d+)", str(t2))
-            if m2 and int(m2.group(1)) == base and abs(j - i) <= 1:
-                base_nearby = True
-                break
-        if not base_nearby:
+        prev_major = majors_at[i - 1] if i > 0 else None
+        next_major = majors_at[i + 1] if i + 1 < len(majors_at) else None
+        if base not in (prev_major, next_major):
             continue
         # If this looks like a jump relative to the other majors, prefer the split form.
         other_majors = [m for m in majors_set if m != n]
@@ -128,18 +186,21 @@ def repair_run_together_subtops(blocks: List[Dict[str, Any]]) -> Dict[str, str]:
     return rewrites
 
 
-def _compute_markers(full_text: str) -> List[Tuple[int, int]]:
-    return [(m.start(), int(m.group(1))) for m in PAGE_MARKER_RE.finditer(full_text)]
+def _compute_markers(full_text: str) -> Tuple[List[int], List[int]]:
+    """Page marker offsets and their page numbers, as parallel lists in text order."""
+    starts: List[int] = []
+    page_numbers: List[int] = []
+    for m in PAGE_MARKER_RE.finditer(full_text):
+        starts.append(m.start())
+        page_numbers.append(int(m.group(1)))
+    return starts, page_numbers
 
 
-def _page_at(markers: List[Tuple[int, int]], pos: int) -> Optional[int]:
-    pg: Optional[int] = None
-    for s, p in markers:
-        if s <= pos:
-            pg = p
-        else:
-            break
-    return pg
+def _page_at(markers: Tuple[List[int], List[int]], pos: int) -> Optional[int]:
+    """Page of the last marker at or before `pos`."""
+    starts, page_numbers = markers
+    i = bisect_right(starts, pos) - 1
+    return page_numbers[i] if i >= 0 else None
 
 
 def split_top_blocks(full_text: str) -> List[Dict[str, Any]]:
@@ -163,44 +224,42 @@ def split_top_blocks(full_text: str) -> List[Dict[str, Any]]:
 
 
 def header_inline_title(line: str) -> Optional[str]:
-    m = re.match(
-        r"(?i)^\s*(?:(?:seite|s\.)\s*\d+[\s\).:-]+|\d+[\s\).:-]+)?"
-        r"(?:T\s*O\s*P|TOP|Tagesordnungspunkt|Tagesordnungs(?:punkt|p\.)?)\s+"
-        r"\d+(?:(?:\s*[.,/]\s*|\s+)\d+)?[a-z]?\s*(.*)$",
-        line.strip(),
-    )
+    m = _HEADER_INLINE_RE.match(line.strip())
     if not m:
         return None
     rest = m.group(1).strip()
     return rest if rest else None
 
 
+def _nonblank_lines(text: str) -> Iterator[str]:
+    """Stripped non-blank lines of `text`, lazily, split like `str.splitlines`."""
+    for m in _LINE_RE.finditer(text):
+        ln = m.group().strip()
+        if ln:
+            yield ln
+
+
 def extract_title(block_text: str) -> Optional[str]:
-    lines = [ln.strip() for ln in block_text.splitlines() if ln.strip()]
-    if not lines:
+    # Only the first dozen lines can contribute, so the block is not split up front.
+    lines = _nonblank_lines(block_text)
+    first = next(lines, None)
+    if first is None:
         return None
 
     # Inline title: "TOP 4 Beschlussfassung über ..."
-    t = header_inline_title(lines[0])
+    t = header_inline_title(first)
     if t:
         t = clean_title_text(t)
     if t and not is_garbage_title(t):
         return t[:240]
 
     # Drop pure header line
-    if re.match(
-        r"(?i)^\s*(?:(?:seite|s\.)\s*\d+[\s\).:-]+|\d+[\s\).:-]+)?"
-        r"(?:T\s*O\s*P|TOP|Tagesordnungspunkt)\s+\d",
-        lines[0],
-    ):
-        lines = lines[1:]
-    if not lines:
-        return None
+    if not _HEADER_ONLY_RE.match(first):
+        lines = chain((first,), lines)
 
-    stop_markers = ("abstimmungsergebnis", "ergebnis", "bemerkung", "sachverhalt", "begründung", "stimmberechtigt")
     title_lines: List[str] = []
-    for ln in lines[:12]:
-        if ln.lower().startswith(stop_markers):
+    for ln in islice(lines, 12):
+        if ln.lower().startswith(_TITLE_STOP_MARKERS):
             break
         ln = clean_title_text(ln)
         if not ln:
@@ -215,84 +274,144 @@ def extract_title(block_text: str) -> Optional[str]:
 
 
 def parse_votes_strict(block: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
-    # Labeled form
-    m = re.search(
-        r"(?is)(?:Ja(?:-Stimmen)?|Jastimmen)\s*[:=]?\s*([\d\.]+).*?"
-        r"(?:Nein(?:-Stimmen)?|Neinstimmen)\s*[:=]?\s*([\d\.]+).*?"
-        r"(?:Enthaltung(?:en)?|Enthaltungen?)\s*[:=]?\s*([\d\.]+)",
-        block,
-    )
-    if m:
-        return safe_int(m.group(1)), safe_int(m.group(2)), safe_int(m.group(3))
+    return _parse_votes(block, block.lower())
+
 
-    # Unlabeled x / y / z ONLY if line hints vote context
-    for ln in block.splitlines():
-        if "/" in ln and re.search(r"(?i)\b(stimmen|ja|nein|enth)\b", ln):
-            m2 = re.search(r"\b([\d\.]{1,10})\s*/\s*([\d\.]{1,10})\s*/\s*([\d\.]{1,10})\b", ln)
+def _parse_votes(block: str, lower: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    # Labeled form. It needs both "nein" and "enthaltung", and most blocks lack one of
+    # them, so two substring checks on the lowercased block spare the (lazy-dot) search.
+    if "enthaltung" in lower and "nein" in lower:
+        m = _VOTES_LABELED_RE.search(block)
+        if m:
+            return safe_int(m.group(1)), safe_int(m.group(2)), safe_int(m.group(3))
+
+    # Unlabeled x / y / z ONLY if line hints vote context. Only lines containing a slash can
+    # match, so jump between slashes instead of splitting the whole block into lines.
+    end = len(block)
+    slash = block.find("/")
+    while slash >= 0:
+        # Same line boundaries as str.splitlines(): "\n" is found quickly, and the rarer
+        # separators only need looking for between it and the slash.
+        line_start = block.rfind("\n", 0, slash) + 1
+        for m in _NON_LF_BREAK_RE.finditer(block, line_start, slash):
+            line_start = m.end()
+        m = _LINE_BREAK_RE.search(block, slash)
+        line_end = m.start() if m else end
+        if _VOTE_HINT_RE.search(block, line_start, line_end):
+            m2 = _VOTES_SLASH_RE.search(block, line_start, line_end)
             if m2:
                 return safe_int(m2.group(1)), safe_int(m2.group(2)), safe_int(m2.group(3))
+        slash = block.find("/", line_end)
 
     return None, None, None
 
 
-def detect_explicit_decision(block: str) -> Optional[bool]:
-    b = block.lower()
-    if any(x in b for x in ["abgelehnt", "nicht angenommen", "nicht beschlossen", "kein beschluss", "zurückgestellt",
-                            "vertagt", "ohne beschluss", "keine beschlussfassung", "keine beschluss", "beschlussfassung entfällt"]):
+def _explicit_decision(lower: str) -> Optional[bool]:
+    if any(x in lower for x in _REJECTED_KEYWORDS):
         return False
-    if any(x in b for x in ["wird angenommen", "angenommen", "beschließt", "wird beschlossen",
-                            "mehrheitlich beschlossen", "beschluss gefasst"]):
+    if any(x in lower for x in _APPROVED_KEYWORDS):
         return True
     return None
 
 
-def mentions_special_quorum(block: str) -> bool:
-    b = block.lower()
-    return any(k in b for k in ["einstimmigkeit", "quorum", "2/3", "zwei drittel", "3/4", "drei viertel", "qualifizierte mehrheit"])
+def _special_quorum(lower: str) -> bool:
+    return any(k in lower for k in _QUORUM_KEYWORDS)
 
 
-def infer_approved(explicit: Optional[bool], yes: Optional[int], no: Optional[int], block: str) -> Optional[bool]:
+def _infer_approved(
+    explicit: Optional[bool], yes: Optional[int], no: Optional[int], lower: str,
+) -> Optional[bool]:
     if explicit is not None:
         return explicit
-    if mentions_special_quorum(block):
+    if _special_quorum(lower):
         return None
     if yes is not None and no is not None:
         return yes > no
     return None
 
 
+def detect_explicit_decision(block: str) -> Optional[bool]:
+    return _explicit_decision(block.lower())
+
+
+def mentions_special_quorum(block: str) -> bool:
+    return _special_quorum(block.lower())
+
+
+def infer_approved(explicit: Optional[bool], yes: Optional[int], no: Optional[int], block: str) -> Optional[bool]:
+    return _infer_approved(explicit, yes, no, block.lower())
+
+
+# Blocks at least this long are treated as decision detail even without votes/keywords.
+_DETAIL_MIN_LEN = 500
+
+
+def _analyze_block(block_text: str, length: int) -> Dict[str, Any]:
+    """
+    Everything the parser derives from a block's text, computed once: the votes, the
+    explicit decision, the block kind and the lowercased text the keyword checks use.
+    """
+    lower = block_text.lower()
+    y, n, a = _parse_votes(block_text, lower)
+    explicit = _explicit_decision(lower)
+    is_detail = (
+        (y is not None and n is not None)
+        or explicit is not None
+        or length >= _DETAIL_MIN_LEN
+        or "verkündet das beschlussergebnis" in lower
+    )
+    return {
+        "kind": "detail" if is_detail else "agenda_or_header",
+        "yes": y,
+        "no": n,
+        "abstain": a,
+        "explicit": explicit,
+        "lower": lower,
+    }
+
+
 def classify_block_kind(block_text: str, length: int) -> str:
-    y, n, _ = parse_votes_strict(block_text)
-    explicit = detect_explicit_decision(block_text)
-    if (y is not None and n is not None) or explicit is not None or length >= 500 or ("verkündet das beschlussergebnis" in block_text.lower()):
+    # Long blocks are detail blocks whatever they contain; skip the vote/keyword scans.
+    if length >= _DETAIL_MIN_LEN:
         return "detail"
-    return "agenda_or_header"
+    return _analyze_block(block_text, length)["kind"]
 
 
 def extract_meeting_date(full_text: str, filename: str) -> Optional[str]:
-    m = re.search(r"(?i)\b(?:vom|am)\s+(\d{1,2})\.(\d{1,2})\.(\d{4})\b", full_text)
-    if m:
-        d, mo, y = int(m.group(1)), int(m.group(2)), int(m.group(3))
-        return f"{y:04d}-{mo:02d}-{d:02d}"
-    m2 = re.search(r"\b([0-3]\d)(0[1-9]|1[0-2])(20\d{2})\b", filename)
-    if m2:
-        d, mo, y = int(m2.group(1)), int(m2.group(2)), int(m2.group(3))
-        return f"{y:04d}-{mo:02d}-{d:02d}"
-    return None
+    # The filename is only consulted when the text has no "vom/am DD.MM.YYYY" date.
+    m = _DATE_TEXT_RE.search(full_text) or _DATE_FILENAME_RE.search(filename)
+    if not m:
+        return None
+    d, mo, y = map(int, m.groups())
+    return f"{y:04d}-{mo:02d}-{d:02d}"
 
 
 def sort_key_top(x: str) -> Tuple[int, str]:
-    m = re.match(r"(\d+)(.*)", str(x))
+    s = str(x)
+    # Most TOP numbers are plain integers ("7"); only "7a" / "7.1" style need the regex.
+    if s.isdecimal():
+        return (int(s), "")
+    m = _SORT_KEY_RE.match(s)
     return (int(m.group(1)), m.group(2))
 
 
-def parse_tops_from_corpus(corpus: Dict[str, Any]) -> List[ParsedTOP]:
+def parse_tops_from_corpus(
+    corpus: Dict[str, Any], *, include_excerpt: bool = True,
+) -> List[ParsedTOP]:
+    """
+    Parse all TOPs of one corpus. With `include_excerpt=False` the `raw_excerpt` field is
+    left empty instead of holding up to 2000 characters of block text per TOP.
+    """
     pages = corpus["pages"]
-    for p in pages:
-        p["text"] = normalize_text(p.get("text", "") or "")
-
-    full_text = join_pages_with_markers(pages)
-    meeting_date = extract_meeting_date(full_text, Path(corpus["source_path"]).name)
+    # Corpora built from the ingest pipeline carry normalised page texts already.
+    if not corpus.get("normalized"):
+        for p in pages:
+            p["text"] = normalize_text(p.get("text", "") or "")
+
+    # Pages are normalised at this point either way, so joining needs no second full pass.
+    full_text = join_pages_with_markers(pages, normalized=True)
+    source_file = Path(corpus["source_path"]).name
+    meeting_date = extract_meeting_date(full_text, source_file)
     blocks = split_top_blocks(full_text)
     # Repair run-together OCR numbers (e.g., "21" instead of "2.1") based on the set of detected TOPs.
     rewrites = repair_run_together_subtops(blocks)
@@ -300,47 +419,46 @@ def parse_tops_from_corpus(corpus: Dict[str, Any]) -> List[ParsedTOP]:
         for b in blocks:
             b["top_number"] = rewrites.get(b["top_number"], b["top_number"])
 
-    # Agenda title map (early list pages)
+    # One pass: analyse each block, collect agenda titles (early list pages) and keep the
+    # best block per TOP, strongly preferring "detail".
     agenda_titles: Dict[str, str] = {}
+    best: Dict[str, Tuple[Tuple[int, int, int, int], Dict[str, Any]]] = {}
     for b in blocks:
-        if classify_block_kind(b["text"], b["len"]) == "agenda_or_header":
-            t = extract_title(b["text"])
+        top_no = b["top_number"]
+        info = b["analysis"] = _analyze_block(b["text"], b["len"])
+        if info["kind"] == "agenda_or_header":
+            # Kept on the block so the emit loop does not extract it again if it wins.
+            t = b["title"] = extract_title(b["text"])
             if t and not is_garbage_title(t):
-                agenda_titles.setdefault(b["top_number"], t)
+                agenda_titles.setdefault(top_no, t)
 
-    # Deduplicate: keep the best block per TOP, strongly preferring "detail".
-    best: Dict[str, Dict[str, Any]] = {}
-    for b in blocks:
-        kind = classify_block_kind(b["text"], b["len"])
-        y, n, _ = parse_votes_strict(b["text"])
-        explicit = detect_explicit_decision(b["text"])
         score = (
-            1 if kind == "detail" else 0,
-            1 if (y is not None and n is not None) else 0,
-            1 if explicit is not None else 0,
+            1 if info["kind"] == "detail" else 0,
+            1 if (info["yes"] is not None and info["no"] is not None) else 0,
+            1 if info["explicit"] is not None else 0,
             b["len"],
         )
-        if b["top_number"] not in best or score > best[b["top_number"]]["score"]:
-            best[b["top_number"]] = {"score": score, **b}
+        if top_no not in best or score > best[top_no][0]:
+            best[top_no] = (score, b)
 
     out: List[ParsedTOP] = []
-    for top_no, b in best.items():
+    for top_no, (_, b) in best.items():
         text = b["text"]
-        y, n, a = parse_votes_strict(text)
-        explicit = detect_explicit_decision(text)
-        approved = infer_approved(explicit, y, n, text)
+        info = b["analysis"]
+        y, n, a = info["yes"], info["no"], info["abstain"]
+        explicit = info["explicit"]
+        approved = _infer_approved(explicit, y, n, info["lower"])
 
-        title = extract_title(text)
+        title = b["title"] if "title" in b else extract_title(text)
         if is_garbage_title(title):
-            title = agenda_titles.get(top_no) or title
-        if is_garbage_title(title):
-            title = agenda_titles.get(top_no) or None
+            # agenda_titles only holds non-garbage titles, so this is the fallback or None.
+            title = agenda_titles.get(top_no)
 
         title_issues = detect_title_orthography_issues(title or "")
 
         out.append(ParsedTOP(
             meeting_date=meeting_date,
-            source_file=Path(corpus["source_path"]).name,
+            source_file=source_file,
             top_number=top_no,
             top_title=title,
             title_issues=title_issues,
@@ -352,17 +470,55 @@ def parse_tops_from_corpus(corpus: Dict[str, Any]) -> List[ParsedTOP]:
             page_start=b.get("page_start"),
             page_end=b.get("page_end"),
             block_len=int(b.get("len") or 0),
-            raw_excerpt=text[:2000],
+            raw_excerpt=text[:2000] if include_excerpt else "",
         ))
 
-    out.sort(key=lambda r: (r.meeting_date or "9999-99-99", sort_key_top(r.top_number)))
+    # Every row of a corpus shares meeting_date, so ordering by TOP number alone is enough.
+    out.sort(key=lambda r: sort_key_top(r.top_number))
     return out
 
 
+_TOP_FIELDS = tuple(f.name for f in fields(ParsedTOP))
+
+
 def parsed_to_dicts(rows: List[ParsedTOP]) -> List[Dict[str, Any]]:
-    return [asdict(r) for r in rows]
+    # Flat equivalent of dataclasses.asdict without its recursive deepcopy; the rows are
+    # only serialised afterwards, so sharing the title_issues list is fine.
+    return [{name: getattr(r, name) for name in _TOP_FIELDS} for r in rows]
+
+
+def parse_many(
+    corpora: Iterable[Dict[str, Any]],
+    *,
+    jobs: int = 1,
+    include_excerpt: bool = True,
+) -> List[List[ParsedTOP]]:
+    """
+    Parse several corpora, one result list per corpus in input order.
+
+    Parsing is pure-Python and CPU-bound, so `jobs > 1` fans the corpora out to worker
+    processes. `WEGTopApp` already parses inside its per-PDF workers; this is for callers
+    that parse saved corpus JSON files in bulk.
+    """
+    corpora = list(corpora)
+    parse = partial(parse_tops_from_corpus, include_excerpt=include_excerpt)
+    if jobs <= 1 or len(corpora) <= 1:
+        return [parse(c) for c in corpora]
+    workers = min(jobs, len(corpora))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # A few corpora per task amortises the pickling round trip without starving workers.
+        chunksize = max(1, len(corpora) // (workers * 4))
+        return list(executor.map(parse, corpora, chunksize=chunksize))
 
 
 class RegexTopParser:
+    def __init__(self, *, include_excerpt: bool = True) -> None:
+        self._include_excerpt = include_excerpt
+
     def parse(self, corpus: Dict[str, Any]) -> List[ParsedTOP]:
-        return parse_tops_from_corpus(corpus)
+        return parse_tops_from_corpus(corpus, include_excerpt=self._include_excerpt)
+
+    def parse_many(
+        self, corpora: Iterable[Dict[str, Any]], *, jobs: int = 1,
+    ) -> List[List[ParsedTOP]]:
+        return parse_many(corpora, jobs=jobs, include_excerpt=self._include_excerpt)
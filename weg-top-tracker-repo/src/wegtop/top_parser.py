@@ -21,6 +21,7 @@ from .parsing.regex_top_parser import (
     extract_meeting_date,
     sort_key_top,
     parse_tops_from_corpus,
+    parse_many,
     parsed_to_dicts,
 )
 
@@ -45,5 +46,6 @@ __all__ = [
     "extract_meeting_date",
     "sort_key_top",
     "parse_tops_from_corpus",
+    "parse_many",
     "parsed_to_dicts",
 ]
@@ -96,6 +96,31 @@ def test_excel_exporter_writes_files(tmp_path):
     assert df_qa.loc[0, "file"] == "a.pdf"
 
 
+def test_export_by_year_sorts_tops_numerically(tmp_path):
+    import pandas as pd
+
+    def row(date, top, approved=True):
+        return {
+            "meeting_date": date, "top_number": top, "top_title": f"TOP {top}",
+            "approved": approved, "votes_yes": None, "votes_no": None, "votes_abstain": None,
+            "source_file": "a.pdf", "page_start": 1, "page_end": 1,
+        }
+
+    all_rows = [
+        row("2024-03-01", "10"), row("2024-03-01", "2.1"), row("2024-03-01", "2"),
+        row("2024-01-01", "3"), row("2024-03-01", "5", approved=False), row(None, "1"),
+        row("2023-06-01", "1"), row("2022-02-01", "1", approved=None),
+    ]
+    by_year = tmp_path / "by_year.xlsx"
+    ExcelExporter().export_by_year(all_tops_rows=all_rows, qa_rows=[], out_path=by_year)
+
+    assert pd.ExcelFile(by_year).sheet_names == ["2022", "2023", "2024", "QA_Summary"]
+    assert pd.read_excel(by_year, sheet_name="2022").empty
+    df_year = pd.read_excel(by_year, sheet_name="2024", dtype=str)
+    assert list(df_year["top_number"]) == ["3", "2", "2.1", "10"]
+    assert "_top_num" not in df_year.columns
+
+
 def test_export_wrappers_delegate(monkeypatch, tmp_path):
     calls = []
 
@@ -169,6 +194,64 @@ def test_app_process_pdfs_success(tmp_path):
     assert exporter.calls[1][0] == "export_by_year"
 
 
+def test_app_process_pdfs_reuses_ingest_cache(tmp_path):
+    class CountingPipeline(DummyPipeline):
+        calls = 0
+
+        def ingest(self, pdf_path):
+            CountingPipeline.calls += 1
+            return super().ingest(pdf_path)
+
+        def config_key(self):
+            return "dummy"
+
+    pdf = tmp_path / "sample.pdf"
+    pdf.write_bytes(b"%PDF")
+    ingested = IngestedPDF(
+        source_path=str(pdf),
+        pages=[PageText(0, "hello", 5)],
+        used_layout=False,
+        used_ocr=False,
+        avg_chars_per_page=5.0,
+    )
+    app = WEGTopApp(
+        ingest_pipeline=CountingPipeline(ingested=ingested),
+        parser=DummyParser([]),
+        exporter=DummyExporter(),
+    )
+
+    out_dir = tmp_path / "out"
+    for _ in range(2):
+        app.process_pdfs([pdf], out_dir, cache_dir=out_dir / ".cache")
+
+    assert CountingPipeline.calls == 1
+    assert (out_dir / "corpus" / "sample.json").exists()
+
+
+def test_app_process_pdfs_parallel_keeps_input_order(tmp_path):
+    ingested = IngestedPDF(
+        source_path="sample.pdf",
+        pages=[PageText(0, "hello", 5)],
+        used_layout=False,
+        used_ocr=False,
+        avg_chars_per_page=5.0,
+    )
+    exporter = DummyExporter()
+    app = WEGTopApp(
+        ingest_pipeline=DummyPipeline(ingested=ingested),
+        parser=DummyParser([]),
+        exporter=exporter,
+    )
+
+    out_dir = tmp_path / "out"
+    pdfs = [Path(f"{name}.pdf") for name in ("a", "b", "c")]
+    app.process_pdfs(pdfs, out_dir, jobs=2)
+
+    qa_rows = exporter.calls[0][1]["qa_rows"]
+    assert [r["file"] for r in qa_rows] == ["a.pdf", "b.pdf", "c.pdf"]
+    assert (out_dir / "corpus" / "b.json").exists()
+
+
 def test_app_process_pdfs_records_errors(tmp_path):
     class FailingPipeline:
         def ingest(self, pdf_path):
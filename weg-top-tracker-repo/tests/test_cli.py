@@ -14,3 +14,33 @@ def test_cli_exits_on_empty_dir(tmp_path, monkeypatch):
     with pytest.raises(SystemExit) as exc:
         cli.main()
     assert "No PDFs found in" in str(exc.value)
+
+
+def test_cli_splits_ocr_workers_over_concurrent_pdfs(tmp_path, monkeypatch):
+    created = []
+
+    class RecordingOcr:
+        def __init__(self, **kwargs):
+            created.append(kwargs["workers"])
+
+    monkeypatch.setattr(cli.os, "cpu_count", lambda: 16)
+    monkeypatch.setattr(cli, "OcrExtractor", RecordingOcr)
+    monkeypatch.setattr(cli.WEGTopApp, "process_pdfs", lambda self, *a, **kw: None)
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+
+    def run(n_pdfs, *extra):
+        in_dir = tmp_path / f"in{n_pdfs}{''.join(extra)}"
+        in_dir.mkdir()
+        for i in range(n_pdfs):
+            (in_dir / f"{i}.pdf").write_bytes(b"")
+        argv = ["wegtop", "--in_dir", str(in_dir), "--out_dir", str(tmp_path / "out"), "--ocr"]
+        monkeypatch.setattr(sys, "argv", argv + list(extra))
+        cli.main()
+        return created[-1]
+
+    # --jobs defaults to the CPU count, but only as many PDFs as exist run at once.
+    assert run(1) == 16
+    assert run(3) == 5
+    assert run(3, "--jobs", "2") == 8
+    assert run(3, "--ocr_workers", "7") == 7
+    assert cli.os.environ["OMP_THREAD_LIMIT"] == "1"
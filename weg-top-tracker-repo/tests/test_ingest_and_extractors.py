@@ -1,14 +1,23 @@
+import contextlib
 from pathlib import Path
 import types
 import sys
 
 import pytest
 
+from wegtop.ingest.cache import IngestCache
 from wegtop.ingest.pipeline import IngestPipeline
-from wegtop.ingest.pdfplumber_extractor import PdfPlumberExtractor
+from wegtop.ingest.pdfplumber_extractor import PdfPlumberExtractor, chars_to_text
 from wegtop.ingest.ocr_extractor import OcrExtractor
+from wegtop.ingest.pymupdf_extractor import PyMuPdfExtractor, PyMuPdfOcrExtractor
 from wegtop.models import PageText, IngestedPDF
-from wegtop.pdf_ingest import load_corpus_json, save_corpus_json, ingested_to_corpus
+from wegtop.pdf_ingest import (
+    ingest_pdf,
+    ingested_to_corpus,
+    load_corpus_json,
+    save_corpus_json,
+    write_corpus_json,
+)
 
 
 class DummyExtractor:
@@ -77,6 +86,58 @@ def test_ingest_pipeline_ignores_ocr_errors():
     assert out.avg_chars_per_page == 80
 
 
+class DummyDocumentExtractor(DummyExtractor):
+    opened = 0
+
+    def open_document(self, pdf_path):
+        DummyDocumentExtractor.opened += 1
+        return contextlib.nullcontext(object())
+
+    def extract_document(self, document):
+        return self.extract(None)
+
+
+class DummySubsetExtractor(DummyExtractor):
+    def __init__(self, pages):
+        super().__init__(pages)
+        self.requested = None
+
+    def extract_pages(self, pdf_path, page_indices):
+        self.requested = list(page_indices)
+        return [p for p in self._pages if p.page_index in self.requested]
+
+
+def test_ingest_pipeline_shares_document_between_passes():
+    DummyDocumentExtractor.opened = 0
+    primary = DummyDocumentExtractor(_pages([50, 50]))
+    layout = DummyDocumentExtractor(_pages([120, 120]))
+    pipeline = IngestPipeline(
+        primary_extractor=primary,
+        layout_extractor=layout,
+        min_avg_chars_per_page=60,
+    )
+
+    out = pipeline.ingest(Path("dummy.pdf"))
+    assert out.used_layout is True
+    assert DummyDocumentExtractor.opened == 1
+    assert (primary.calls, layout.calls) == (1, 1)
+
+
+def test_ingest_pipeline_ocrs_only_weak_pages():
+    primary = DummyExtractor(_pages([400, 10, 10]))
+    ocr = DummySubsetExtractor(_pages([5, 400, 400]))
+    pipeline = IngestPipeline(
+        primary_extractor=primary,
+        ocr_extractor=ocr,
+        min_avg_chars_per_page=250,
+    )
+
+    out = pipeline.ingest(Path("dummy.pdf"))
+    assert ocr.requested == [1, 2]
+    assert out.used_ocr is True
+    assert [p.char_count for p in out.pages] == [400, 400, 400]
+
+
 def test_pdfplumber_extractor_handles_layout_typeerror(monkeypatch):
     import pdfplumber
 
@@ -112,12 +173,102 @@ def test_pdfplumber_extractor_handles_layout_typeerror(monkeypatch):
     assert pages[1].text == "C"
 
 
+def test_pdfplumber_extractor_shards_pages_across_workers(monkeypatch):
+    import concurrent.futures
+    import pdfplumber
+    from wegtop.ingest import pdfplumber_extractor
+
+    class FakePage:
+        def __init__(self, number):
+            self.page_number = number
+
+        def extract_text(self, layout=None):
+            return f"page {self.page_number}"
+
+    opened = []
+
+    class FakePDF:
+        path = Path("dummy.pdf")
+
+        def __init__(self, pages=None):
+            numbers = pages or range(1, 11)
+            opened.append(list(numbers))
+            self.pages = [FakePage(n) for n in numbers]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    monkeypatch.setattr(pdfplumber, "open", lambda _, pages=None: FakePDF(pages))
+    # Threads stand in for processes so the fake PDF is visible to the workers.
+    monkeypatch.setattr(
+        pdfplumber_extractor, "ProcessPoolExecutor", concurrent.futures.ThreadPoolExecutor,
+    )
+
+    pages = PdfPlumberExtractor(layout=False, workers=8).extract(Path("dummy.pdf"))
+
+    assert [p.page_index for p in pages] == list(range(10))
+    assert pages[9].text == "page 10"
+    # 10 pages allow two workers at MIN_PAGES_PER_WORKER=4.
+    assert opened[1:] == [[1, 2, 3, 4, 5], [6, 7, 8, 9, 10]]
+
+
+def test_chars_to_text_orders_lines_and_words():
+    def ch(text, x0, top):
+        return {"text": text, "x0": x0, "x1": x0 + 5, "top": top}
+
+    chars = [
+        ch("B", 30, 100.4), ch("y", 5, 120), ch("A", 0, 100), ch("x", 0, 120), ch("C", 35, 100),
+    ]
+    assert chars_to_text(chars) == "A BC\nxy"
+
+
+def test_chars_to_text_keeps_jittered_tops_on_one_line():
+    def ch(text, x0, top):
+        return {"text": text, "x0": x0, "x1": x0 + 5, "top": top}
+
+    # Tops either side of a multiple of line_tolerance still belong to one visual line.
+    chars = [ch("A", 0, 100.0), ch("b", 5, 101.0), ch("C", 20, 100.0), ch("d", 25, 101.0)]
+    assert chars_to_text(chars) == "Ab Cd"
+    chars = [ch("W", 0, 4.4), ch("o", 5, 4.6), ch("r", 10, 4.4), ch("t", 15, 4.6), ch("x", 0, 20)]
+    assert chars_to_text(chars) == "Wort\nx"
+
+
+def test_pdfplumber_extractor_layout_uses_chars(monkeypatch):
+    import pdfplumber
+
+    class FakePage:
+        chars = [{"text": "Z", "x0": 0, "x1": 5, "top": 0}]
+
+        def extract_text(self, layout=None):
+            raise AssertionError("layout extraction should not run")
+
+    class FakePDF:
+        pages = [FakePage()]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    monkeypatch.setattr(pdfplumber, "open", lambda _: FakePDF())
+    pages = PdfPlumberExtractor(layout=True).extract(Path("dummy.pdf"))
+
+    assert pages[0].text == "Z"
+
+
 def test_ocr_extractor_limits_pages(monkeypatch):
     def pdfinfo_from_path(_):
         return {"Pages": 2}
 
-    def convert_from_path(_, dpi, first_page, last_page):
-        return [f"img{first_page}"]
+    calls = []
+
+    def convert_from_path(_, dpi, first_page, last_page, **kwargs):
+        calls.append((first_page, last_page))
+        return [f"img{n}" for n in range(first_page, last_page + 1)]
 
     pdf2image = types.SimpleNamespace(
         convert_from_path=convert_from_path,
@@ -135,6 +286,148 @@ def test_ocr_extractor_limits_pages(monkeypatch):
 
     assert len(pages) == 1
     assert pages[0].text == "text-img1"
+    assert calls == [(1, 1)]
+
+
+def test_ocr_extractor_renders_all_pages_in_one_call(monkeypatch):
+    calls = []
+
+    def convert_from_path(_, dpi, first_page, last_page, **kwargs):
+        calls.append((first_page, last_page, kwargs["thread_count"]))
+        return [f"img{n}" for n in range(first_page, last_page + 1)]
+
+    pdf2image = types.SimpleNamespace(
+        convert_from_path=convert_from_path,
+        pdfinfo_from_path=lambda _: {"Pages": 3},
+    )
+    pytesseract = types.SimpleNamespace(
+        image_to_string=lambda img, lang: f"text-{img}",
+    )
+
+    monkeypatch.setitem(sys.modules, "pdf2image", pdf2image)
+    monkeypatch.setitem(sys.modules, "pytesseract", pytesseract)
+
+    pages = OcrExtractor(workers=8).extract(Path("dummy.pdf"))
+
+    assert calls == [(1, 3, 3)]
+    assert [p.page_index for p in pages] == [0, 1, 2]
+    assert pages[2].text == "text-img3"
+
+
+def test_ocr_extractor_renders_contiguous_page_runs(monkeypatch):
+    calls = []
+
+    def convert_from_path(_, dpi, first_page, last_page, **kwargs):
+        calls.append((first_page, last_page))
+        return [f"img{n}" for n in range(first_page, last_page + 1)]
+
+    pdf2image = types.SimpleNamespace(convert_from_path=convert_from_path)
+    pytesseract = types.SimpleNamespace(
+        image_to_string=lambda img, lang: f"text-{img}",
+    )
+
+    monkeypatch.setitem(sys.modules, "pdf2image", pdf2image)
+    monkeypatch.setitem(sys.modules, "pytesseract", pytesseract)
+
+    pages = OcrExtractor().extract_pages(Path("dummy.pdf"), [4, 0, 1, 5])
+
+    assert calls == [(1, 2), (5, 6)]
+    assert [(p.page_index, p.text) for p in pages] == [
+        (0, "text-img1"),
+        (1, "text-img2"),
+        (4, "text-img5"),
+        (5, "text-img6"),
+    ]
+
+
+def test_ocr_extractor_binarizes_pages(monkeypatch, tmp_path):
+    np = pytest.importorskip("numpy")
+    image_mod = pytest.importorskip("PIL.Image")
+
+    gray = np.full((20, 20), 200, dtype=np.uint8)
+    gray[5:15, 5:15] = 60
+    image_path = tmp_path / "page.png"
+    image_mod.fromarray(gray).convert("RGB").save(image_path)
+
+    seen = {}
+
+    def image_to_string(path, lang, config):
+        with image_mod.open(path) as img:
+            seen["mode"] = img.mode
+            seen["values"] = sorted(set(np.asarray(img.convert("L")).ravel().tolist()))
+        seen["config"] = config
+        return "ok"
+
+    pytesseract = types.SimpleNamespace(image_to_string=image_to_string)
+    monkeypatch.setitem(sys.modules, "pytesseract", pytesseract)
+    monkeypatch.setattr(OcrExtractor, "_render_pages", lambda *_: [str(image_path)])
+
+    pages = OcrExtractor(binarize=True).extract_pages(Path("dummy.pdf"), [0])
+
+    assert pages[0].text == "ok"
+    assert seen == {"mode": "1", "values": [0, 255], "config": "-c tessedit_do_invert=0"}
+
+
+class FakeMuPage:
+    def __init__(self, text):
+        self._text = text
+        self.sorted_calls = []
+
+    def get_text(self, kind, sort=False):
+        self.sorted_calls.append(sort)
+        return self._text
+
+    def get_pixmap(self, dpi):
+        page = self
+
+        class Pixmap:
+            def save(self, path):
+                Path(path).write_text(f"{page._text}@{dpi}", encoding="utf-8")
+
+        return Pixmap()
+
+
+class FakeMuDocument(list):
+    @property
+    def page_count(self):
+        return len(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+def _fake_pymupdf(monkeypatch, texts):
+    pages = [FakeMuPage(t) for t in texts]
+    monkeypatch.setitem(
+        sys.modules, "pymupdf", types.SimpleNamespace(open=lambda _: FakeMuDocument(pages)),
+    )
+    return pages
+
+
+def test_pymupdf_extractor_reads_pages(monkeypatch):
+    pages = _fake_pymupdf(monkeypatch, ["Erste  Seite", None])
+
+    out = PyMuPdfExtractor(layout=True).extract(Path("dummy.pdf"))
+
+    assert [(p.page_index, p.text) for p in out] == [(0, "Erste Seite"), (1, "")]
+    assert pages[0].sorted_calls == [True]
+
+
+def test_pymupdf_ocr_extractor_renders_selected_pages(monkeypatch):
+    _fake_pymupdf(monkeypatch, ["a", "b", "c"])
+    pytesseract = types.SimpleNamespace(
+        image_to_string=lambda path, lang: Path(path).read_text(encoding="utf-8"),
+    )
+    monkeypatch.setitem(sys.modules, "pytesseract", pytesseract)
+
+    extractor = PyMuPdfOcrExtractor(dpi=100)
+
+    assert [p.text for p in extractor.extract(Path("dummy.pdf"))] == ["a@100", "b@100", "c@100"]
+    out = extractor.extract_pages(Path("dummy.pdf"), [2, 0])
+    assert [(p.page_index, p.text) for p in out] == [(0, "a@100"), (2, "c@100")]
 
 
 def test_corpus_roundtrip(tmp_path):
@@ -153,6 +446,85 @@ def test_corpus_roundtrip(tmp_path):
     assert data["pages"][0]["text"] == "hello"
     assert ingested_to_corpus(ingested)["pages"][0]["char_count"] == 5
 
+    dict_path = tmp_path / "nested" / "corpus.json"
+    write_corpus_json(ingested_to_corpus(ingested), dict_path)
+    assert dict_path.read_bytes() == out_path.read_bytes()
+    # The plain corpus file stays indented for people inspecting an extraction.
+    assert out_path.read_bytes().startswith(b'{\n  "source_path"')
+
+    gz_path = tmp_path / "corpus.json.gz"
+    write_corpus_json(ingested_to_corpus(ingested), gz_path)
+    assert gz_path.read_bytes()[:2] == b"\x1f\x8b"
+    assert load_corpus_json(gz_path) == load_corpus_json(out_path)
+
+
+def test_ingest_cache_roundtrip_and_invalidation(tmp_path):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF-1.4 one")
+    ingested = IngestedPDF(
+        source_path=str(pdf),
+        pages=[PageText(0, "hällo", 5)],
+        used_layout=True,
+        used_ocr=False,
+        avg_chars_per_page=5.0,
+    )
+    cache = IngestCache(tmp_path / ".cache", config_key="cfg")
+
+    entry = cache.entry_path(pdf)
+    assert cache.load(entry) is None
+    cache.store(entry, ingested)
+    assert cache.load(cache.entry_path(pdf)) == ingested
+    other = IngestCache(tmp_path / ".cache", config_key="other")
+    assert other.load(other.entry_path(pdf)) is None
+
+    pdf.write_bytes(b"%PDF-1.4 changed")
+    assert cache.load(cache.entry_path(pdf)) is None
+
+
+def test_ingest_cache_store_failure_is_not_fatal(tmp_path, caplog):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_bytes(b"")
+    cache = IngestCache(blocker / ".cache", config_key="cfg")
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+    ingested = IngestedPDF(
+        source_path=str(pdf), pages=[], used_layout=False, used_ocr=False, avg_chars_per_page=0.0,
+    )
+
+    cache.store(cache.entry_path(pdf), ingested)
+
+    assert "Could not write ingest cache entry" in caplog.text
+
+
+def test_ingest_pdf_cache_dir_skips_repeat_extraction(tmp_path, monkeypatch):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF-1.4 one")
+    calls = []
+
+    def fake_ingest(self, pdf_path):
+        calls.append(pdf_path)
+        return IngestedPDF(str(pdf_path), [PageText(0, "text", 4)], False, False, 4.0)
+
+    monkeypatch.setattr(IngestPipeline, "ingest", fake_ingest)
+    first = ingest_pdf(pdf, enable_ocr=False, cache_dir=tmp_path / ".cache")
+    assert ingest_pdf(pdf, enable_ocr=False, cache_dir=tmp_path / ".cache") == first
+    assert len(calls) == 1
+
+    # Different settings must not hit the entry written above.
+    ingest_pdf(pdf, enable_ocr=False, min_avg_chars_per_page=10, cache_dir=tmp_path / ".cache")
+    assert len(calls) == 2
+
+
+def test_ingest_pipeline_config_key_tracks_settings():
+    def pipeline(**kwargs):
+        return IngestPipeline(primary_extractor=PdfPlumberExtractor(layout=False), **kwargs)
+
+    assert pipeline().config_key() == pipeline().config_key()
+    assert pipeline().config_key() != pipeline(min_avg_chars_per_page=10).config_key()
+    assert pipeline().config_key() != pipeline(
+        layout_extractor=PdfPlumberExtractor(layout=True),
+    ).config_key()
+
 
 def test_load_corpus_json_validation(tmp_path):
     bad = tmp_path / "bad.json"
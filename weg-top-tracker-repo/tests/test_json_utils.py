@@ -0,0 +1,29 @@
+import json
+
+import pytest
+
+from wegtop import json_utils
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    return request.param
+
+
+def test_dumps_is_compact_utf8(backend):
+    out = json_utils.dumps({"title": "Übernahme", "votes": [1, None]})
+    assert out == '{"title":"Übernahme","votes":[1,null]}'.encode("utf-8")
+
+
+def test_dumps_indent_matches_stdlib_layout(backend):
+    payload = {"source_path": "a.pdf", "pages": [{"page_index": 0, "text": "ä"}]}
+    expected = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+    assert json_utils.dumps(payload, indent=True) == expected
+
+
+def test_loads_accepts_bytes(backend):
+    assert json_utils.loads('{"a": "ö"}'.encode("utf-8")) == {"a": "ö"}
@@ -14,7 +14,12 @@ from wegtop.parsing.regex_top_parser import (
     parse_tops_from_corpus,
     is_garbage_title,
     header_inline_title,
+    join_pages_with_markers,
+    split_top_blocks,
+    sort_key_top,
+    parse_many,
 )
+from wegtop.text_utils import normalize_text
 
 
 def test_normalize_top_number_variants():
@@ -24,6 +29,14 @@ def test_normalize_top_number_variants():
     assert normalize_top_number("4a") == "4a"
 
 
+def test_sort_key_top_integer_fast_path_matches_regex_keys():
+    assert sort_key_top("7") == (7, "")
+    assert sort_key_top(12) == (12, "")
+    assert sort_key_top("7a") == (7, "a")
+    assert sort_key_top("17.1") == (17, ".1")
+    assert sorted(["10", "2", "2a", "1.1", "1"], key=sort_key_top) == ["1", "1.1", "2", "2a", "10"]
+
+
 def test_repair_run_together_subtops():
     blocks = [
         {"top_number": "2"},
@@ -44,6 +57,13 @@ def test_parse_votes_strict_labeled_and_unlabeled():
     assert parse_votes_strict("ohne stimmen") == (None, None, None)
 
 
+def test_parse_votes_strict_slash_form_uses_splitlines_boundaries():
+    # A form feed ends a line just like "\n": the hint on the previous line does not count.
+    assert parse_votes_strict("Stimmen\f12/3/1") == (None, None, None)
+    assert parse_votes_strict("Seite 3\fStimmen 12/3/1\x0bDatum 01/02/2021") == (12, 3, 1)
+    assert parse_votes_strict("Stimmen 12\r3/1") == (None, None, None)
+
+
 def test_decision_inference_and_quorum():
     assert detect_explicit_decision("Beschluss wird beschlossen") is True
     assert detect_explicit_decision("Beschluss abgelehnt") is False
@@ -96,5 +116,46 @@ def test_parse_tops_from_corpus_end_to_end():
     assert len(parsed) == 1
     assert parsed[0].top_number == "1"
     assert parsed[0].approved is True
+    assert parsed[0].raw_excerpt.startswith("TOP 1 Wirtschaftsplan")
 
     assert top_parser.parse_tops_from_corpus is parse_tops_from_corpus
+    assert parse_tops_from_corpus(corpus, include_excerpt=False)[0].raw_excerpt == ""
+
+
+def test_parse_many_matches_single_parses_in_order():
+    corpora = [
+        {
+            "source_path": f"Protokoll vom 0{i}.03.2024.pdf",
+            "pages": [{"page_index": 0, "text": f"TOP {i} Punkt {i}\nwird beschlossen\n"}],
+        }
+        for i in range(1, 4)
+    ]
+    expected = [
+        parse_tops_from_corpus(dict(c, pages=[dict(p) for p in c["pages"]])) for c in corpora
+    ]
+
+    assert parse_many(corpora) == expected
+    assert parse_many(corpora, jobs=2) == expected
+    assert top_parser.parse_many is parse_many
+
+
+def test_join_pages_with_markers_skips_renormalising_normalized_pages():
+    raw = ["TOP 1  Wirt-\nschaftsplan\n\n\n\n\nDSZ_X", "", "", "  Ja-Stimmen: 3 "]
+    pages = [{"page_index": i, "text": normalize_text(t)} for i, t in enumerate(raw)]
+
+    assert join_pages_with_markers(pages, normalized=True) == join_pages_with_markers(pages)
+
+
+def test_split_top_blocks_assigns_pages_from_markers():
+    text = (
+        "TOP 1 Vorab\n"
+        "<<<PAGE:0>>>\nTOP 2 Erster\nText\n"
+        "<<<PAGE:1>>>\nmehr\n<<<PAGE:2>>>\nTOP 3 Dritter\n"
+    )
+    blocks = split_top_blocks(text)
+
+    assert [(b["top_number"], b["page_start"], b["page_end"]) for b in blocks] == [
+        ("1", None, 0),
+        ("2", 0, 2),
+        ("3", 2, 2),
+    ]
@@ -1,3 +1,5 @@
+import random
+
 from wegtop.text_utils import normalize_text, clean_title_text, safe_int, detect_title_orthography_issues
 
 
@@ -6,6 +8,34 @@ def test_normalize_text_repairs_hyphenation_and_umlauts():
     assert normalize_text(raw) == "Verwalter Änderung"
 
 
+def test_normalize_text_umlaut_repair_matches_sequential_replacements():
+    def sequential(text):
+        for base, umlaut in zip("aouAOU", "äöüÄÖÜ"):
+            text = text.replace(base + "¨", umlaut)
+        for base, umlaut in zip("aouAOU", "äöüÄÖÜ"):
+            text = text.replace("¨" + base, umlaut)
+        return text
+
+    rng = random.Random(0)
+    for _ in range(2000):
+        raw = "".join(rng.choice("aoAUx¨") for _ in range(rng.randint(1, 8)))
+        assert normalize_text(raw) == sequential(raw), raw
+
+
+def test_normalize_text_is_idempotent():
+    pieces = [
+        "a", "o", "-", "-\n", "\n", " ", "\t", "¨", "\r\n", "DSZ_A", " ALTMP_x.PDF ", "ü",
+        "\x0c", "\xa0", "\x0b",
+    ]
+    rng = random.Random(1)
+    for _ in range(2000):
+        raw = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 12)))
+        once = normalize_text(raw)
+        assert normalize_text(once) == once, raw
+
+    assert normalize_text("a-\nb-\nc") == "abc"
+
+
 def test_clean_title_text_removes_noise_and_repeats():
     raw = "<<<PAGE:2>>> SEEEEEDEE Beschlussfassung"
     cleaned = clean_title_text(raw)
@@ -23,3 +53,9 @@ def test_detect_title_orthography_issues():
     assert "repeated_characters" in issues
     assert "repeated_punctuation" in issues
     assert "all_caps_long" in issues
+
+    assert detect_title_orthography_issues("Hzgkst Abr2024x ok") == [
+        "mixed_alnum_token",
+        "no_vowel_token",
+    ]
+    assert detect_title_orthography_issues("Wirtschaftsplan 2025") == []